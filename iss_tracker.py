@@ -1,24 +1,267 @@
-import xmltodict
 import requests
-import math
 import json
 import time
-from flask import Flask, request
+import calendar
+import functools
+import threading
+import numpy as np
+import orjson
+from xml.etree import ElementTree
+from flask import Flask, Response, abort, request
+from flask.json.provider import DefaultJSONProvider
 from geopy.geocoders import Nominatim
 
 geocoder = Nominatim(user_agent='iss_tracker')
 
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes responses with orjson instead of the standard library json module
+    """
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serializes obj to a JSON string, keeping Flask's sorted keys and debug mode indentation
+
+        Args:
+            obj: the object to serialize
+            kwargs: the json.dumps style options Flask passes in, only sort_keys and indent are used
+
+        Returns:
+            output (str): the JSON string
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserializes a JSON string or bytes
+
+        Args:
+            s (str or bytes): the JSON to deserialize
+            kwargs: ignored, orjson does not take json.loads options
+
+        Returns:
+            output: the deserialized object
+        """
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# keep the indented output the debug server gave when running under gunicorn, it matches the pre-serialized routes
+app.json.compact = False
 
 MEAN_EARTH_RADIUS = 6378.137 #in units of km
+REFRESH_INTERVAL = 3600 #in units of seconds
+ISS_DATA_URL = 'https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml'
+
+@functools.lru_cache(maxsize=4096)
+def reverse_geocode(lat_tenths: int, lon_tenths: int):
+    """
+    Looks up the geoposition for a point on a 0.1 degree grid, results are cached since the ISS passes over the same grid cells and each lookup is a request to Nominatim
+
+    Args:
+        lat_tenths (int): the latitude rounded to tenths of a degree, multiplied by 10
+        lon_tenths (int): the longitude rounded to tenths of a degree, multiplied by 10
+
+    Returns:
+        geoposition (geopy.location.Location): the geocoder result, or None if the point is over the ocean
+    """
+    return geocoder.reverse((lat_tenths/10, lon_tenths/10), zoom=10, language='en')
+
+@functools.lru_cache(maxsize=16384)
+def epoch_to_secs(epoch: str) -> float:
+    """
+    Converts an epoch time stamp to seconds since the unix epoch, results are cached since most epochs are unchanged between reloads of the data
+
+    Args:
+        epoch (str): the time stamp for a data point in UTC (eg 2023-058T12:00:00.000Z)
+
+    Returns:
+        secs (float): the epoch time in seconds since the unix epoch
+    """
+    # the epoch format is fixed (year-dayThour:min:sec), so slice it instead of using strptime
+    year = int(epoch[0:4])
+    day = int(epoch[5:8])
+    hrs = int(epoch[9:11])
+    mins = int(epoch[12:14])
+    secs = int(epoch[15:17])
+    return float(calendar.timegm((year, 1, 1, hrs, mins, secs)) + (day - 1)*86400)
+
+class State:
+    """
+    One loaded copy of the ISS dataset. A State is never modified after it is built, reloading or deleting the data builds a new one and swaps the
+    module level reference, so each request reads from the single State it looked up when it started
+
+    Attributes:
+        cached_responses (dict): JSON bytes for the '/', '/header', '/metadata', and '/comment' routes
+        all_epochs (list): list of the epoch strings, kept as a list so the '/epochs' route can slice it
+        epochs (np.ndarray): array of the epoch strings
+        positions (np.ndarray): (N, 3) array of the {X, Y, Z} position in km at each epoch
+        velocities (np.ndarray): (N, 3) array of the {X_DOT, Y_DOT, Z_DOT} velocity in km/s at each epoch
+        epoch_index (dict): maps each epoch string to its row in the arrays
+        epoch_secs (np.ndarray): array of each epoch in seconds since the unix epoch
+        latitudes (np.ndarray): array of the latitude in degrees at each epoch
+        longitudes (np.ndarray): array of the longitude in degrees at each epoch
+        altitudes (np.ndarray): array of the altitude in km at each epoch
+        speeds (np.ndarray): array of the instantaneous speed in km/s at each epoch
+    """
+    __slots__ = ('cached_responses', 'all_epochs', 'epochs', 'positions', 'velocities', 'epoch_index', 'epoch_secs', 'latitudes', 'longitudes', 'altitudes', 'speeds')
+
+    def __init__(self, **attributes):
+        for name in self.__slots__:
+            setattr(self, name, attributes[name])
+
+def build_state(cached_responses: dict, epoch_list: list, position_list: list, velocity_list: list) -> State:
+    """
+    Converts the parsed state vectors into NumPy arrays so that the routes don't have to re-parse the data on every request
+
+    Args:
+        cached_responses (dict): JSON bytes for the static routes from serialize_responses
+        epoch_list (list): list of the epoch strings
+        position_list (list): list of [X, Y, Z] positions in km at each epoch
+        velocity_list (list): list of [X_DOT, Y_DOT, Z_DOT] velocities in km/s at each epoch
+
+    Returns:
+        state (State): the loaded dataset
+    """
+    epochs = np.array(epoch_list, dtype=str)
+    positions = np.array(position_list, dtype=np.float64).reshape(-1, 3)
+    velocities = np.array(velocity_list, dtype=np.float64).reshape(-1, 3)
+    epoch_index = {epoch: i for i, epoch in enumerate(epochs.tolist())}
+    epoch_secs = np.fromiter((epoch_to_secs(epoch) for epoch in epochs.tolist()), dtype=np.float64, count=len(epochs))
+    x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+    # distance from the earth's axis, shared by the latitude and altitude calculations
+    rho = np.hypot(x, y)
+    latitudes = np.degrees(np.arctan2(z, rho))
+    # hours and minutes of the day at each epoch, used to correct the longitude for the earth's rotation
+    secs_of_day = epoch_secs % 86400
+    hrs = secs_of_day // 3600
+    mins = (secs_of_day % 3600) // 60
+    longitudes = np.degrees(np.arctan2(y, x)) - ((hrs-12)+(mins/60))*(360/24) + 32
+    longitudes = np.where(longitudes > 180, longitudes - 360, longitudes)
+    longitudes = np.where(longitudes < -180, longitudes + 360, longitudes)
+    altitudes = np.hypot(rho, z) - MEAN_EARTH_RADIUS
+    speeds = np.hypot(np.hypot(velocities[:, 0], velocities[:, 1]), velocities[:, 2])
+    return State(cached_responses=cached_responses, all_epochs=list(epoch_list), epochs=epochs, positions=positions, velocities=velocities,
+                 epoch_index=epoch_index, epoch_secs=epoch_secs, latitudes=latitudes, longitudes=longitudes, altitudes=altitudes, speeds=speeds)
+
+def local_name(tag: str) -> str:
+    """
+    Strips the namespace from an xml tag, so '{namespace}stateVector' and 'stateVector' are both matched as 'stateVector'
+
+    Args:
+        tag (str): the tag of an xml element
+
+    Returns:
+        name (str): the tag without its namespace
+    """
+    return tag.rpartition('}')[2]
+
+def element_text(elem) -> str:
+    """
+    Returns the stripped text of an xml element, or None if the element has no text
+
+    Args:
+        elem (ElementTree.Element): the xml element
+
+    Returns:
+        text (str): the text inside the element
+    """
+    if elem.text is None:
+        return None
+    return elem.text.strip() or None
+
+def serialize_responses(iss_data: list, header: dict, metadata: dict, comments: list) -> dict:
+    """
+    Serializes the parts of the dataset that only change when the data is reloaded, so the routes for them can return the bytes without encoding on every request
+
+    Args:
+        iss_data (list): list of state vector dictionaries for the '/' route
+        header (dict): header dictionary in ISS dataset
+        metadata (dict): metadata dictionary in ISS dataset
+        comments (list): list of comments in ISS dataset
+
+    Returns:
+        cached_responses (dict): JSON bytes for the '/', '/header', '/metadata', and '/comment' routes
+    """
+    outputs = {'index': iss_data, 'header': header, 'metadata': metadata, 'comment': comments}
+    return {name: (app.json.dumps(output, indent=2) + '\n').encode() for name, output in outputs.items()}
+
+def load_iss_data() -> State:
+    """
+    Downloads the ISS trajectory xml and parses it in a single streaming pass, pulling the state vectors straight into lists for the NumPy arrays
+
+    Args:
+        no arguments
 
-response = requests.get(url='https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml')
-iss_data_all = xmltodict.parse(response.text)
-# get the state vectors data
-iss_data = iss_data_all['ndm']['oem']['body']['segment']['data']['stateVector']
+    Returns:
+        state (State): the loaded dataset
+    """
+    iss_data = []
+    header = {}
+    metadata = {}
+    comments = []
+    epoch_list = []
+    position_list = []
+    velocity_list = []
+    # stream the gzip compressed response straight into the parser instead of holding the whole document as a string
+    with requests.get(url=ISS_DATA_URL, headers={'Accept-Encoding': 'gzip'}, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        for event, elem in ElementTree.iterparse(response.raw, events=('end',)):
+            tag = local_name(elem.tag)
+            if tag == 'stateVector':
+                state_vec = {}
+                for child in elem:
+                    units = child.get('units')
+                    if units is None:
+                        state_vec[local_name(child.tag)] = element_text(child)
+                    else:
+                        state_vec[local_name(child.tag)] = {'#text': element_text(child), '@units': units}
+                iss_data.append(state_vec)
+                epoch_list.append(state_vec['EPOCH'])
+                position_list.append([float(state_vec[key]['#text']) for key in ('X', 'Y', 'Z')])
+                velocity_list.append([float(state_vec[key]['#text']) for key in ('X_DOT', 'Y_DOT', 'Z_DOT')])
+                # free the parsed children since the values have been copied out
+                elem.clear()
+            elif tag == 'data':
+                comments = [element_text(child) for child in elem if local_name(child.tag) == 'COMMENT']
+            elif tag == 'header':
+                header = {local_name(child.tag): element_text(child) for child in elem}
+            elif tag == 'metadata':
+                metadata = {local_name(child.tag): element_text(child) for child in elem}
+    return build_state(serialize_responses(iss_data, header, metadata, comments), epoch_list, position_list, velocity_list)
+
+state = load_iss_data()
+refresh_requested = threading.Event()
+
+def refresh_data() -> None:
+    """
+    Runs in a background thread and reloads the ISS data every REFRESH_INTERVAL seconds, or as soon as the '/post-data' route requests it
+
+    Args:
+        no arguments
+
+    Returns:
+        no return, loops forever
+    """
+    global state
+    while True:
+        refresh_requested.wait(REFRESH_INTERVAL)
+        refresh_requested.clear()
+        try:
+            state = load_iss_data()
+        except Exception:
+            # keep serving the data we already have and try again on the next refresh
+            app.logger.exception('Failed to reload the ISS data')
+
+threading.Thread(target=refresh_data, daemon=True).start()
 
 @app.route('/', methods=['GET'])
-def index() -> list:
+def index() -> Response:
     """
     Returns the ISS dataset (epoch, position, and velocity at each point) for the '/' route
     
@@ -26,9 +269,9 @@ def index() -> list:
         no arguments
     
     Returns:
-        iss_dat (list): the ISS data set as a list
+        iss_dat (Response): the ISS data set as a JSON list
     """
-    return iss_data
+    return Response(state.cached_responses['index'], mimetype='application/json')
 
 @app.route('/epochs', methods=['GET'])
 def get_epochs() -> list:
@@ -41,28 +284,24 @@ def get_epochs() -> list:
     Returns:
         epochs_list (list): list of strings of the time stamps, or the epochs
     """
-    offset = request.args.get('offset', str(0))
-    limit = request.args.get('limit', str(len(iss_data)))
-    if offset:
-        try:
-            offset = int(offset)
-        except ValueError:
-            return "Bad input: please specify a positive integer for offset\n"
-    if limit:
-        try:
-            limit = int(limit)
-        except ValueError:
-             return "Bad input: please specify a positive integer for limit\n"
-    epochs_list = []
-    count = 0
-    index = 0
-    for state_vec in iss_data:
-        if (count == limit):
-            break
-        if index >= offset:
-            epochs_list.append(state_vec['EPOCH'])
-            count += 1
-        index += 1
+    current = state
+    # empty values fall back to the defaults so offset and limit are always converted to ints
+    offset = request.args.get('offset') or str(0)
+    limit = request.args.get('limit') or str(len(current.all_epochs))
+    try:
+        offset = int(offset)
+    except ValueError:
+        return "Bad input: please specify a positive integer for offset\n"
+    try:
+        limit = int(limit)
+    except ValueError:
+         return "Bad input: please specify a positive integer for limit\n"
+    # negative values keep the old behavior of starting at the first epoch and not limiting the results
+    start = max(offset, 0)
+    if limit < 0:
+        epochs_list = current.all_epochs[start:]
+    else:
+        epochs_list = current.all_epochs[start:start+limit]
     return epochs_list
 
 @app.route('/epochs/<epoch>', methods=['GET'])
@@ -74,72 +313,89 @@ def get_state_vectors(epoch: str) -> dict:
         epoch (str): the time stamp for a data point
 
     Returns:
-        epoch_output (dict): the state vectors from the specified epoch, if epoch not found, will return empty dictionary, position {X, Y, Z} has units of km and the velocity vector coordinates {X_DOT, Y_DOT, Z_DOT} has units of km/s
-    """
-    epoch_output = {}
-    for state_vec in iss_data:
-        if state_vec['EPOCH'] == epoch:
-            epoch_output = state_vec
-            for key in epoch_output:
-                if key != 'EPOCH':
-                    if type(epoch_output[key]) == dict:
-                        epoch_output[key] = float(epoch_output[key]['#text'])
+        epoch_output (dict): the state vectors from the specified epoch, if epoch not found, will return a 404 error, position {X, Y, Z} has units of km and the velocity vector coordinates {X_DOT, Y_DOT, Z_DOT} has units of km/s
+    """
+    current = state
+    i = current.epoch_index.get(epoch)
+    if i is None:
+        abort(404, description=f'Epoch {epoch} was not found in the ISS dataset')
+    x, y, z = current.positions[i].tolist()
+    x_dot, y_dot, z_dot = current.velocities[i].tolist()
+    epoch_output = {'EPOCH': epoch, 'X': x, 'Y': y, 'Z': z, 'X_DOT': x_dot, 'Y_DOT': y_dot, 'Z_DOT': z_dot}
     return epoch_output
 
+def speed_at(current: State, i: int) -> dict:
+    """
+    Looks up the precomputed instantaneous speed at a row of the dataset
+
+    Args:
+        current (State): the dataset to read from
+        i (int): the row of the epoch in the dataset
+
+    Returns:
+        speed_dict (dict): the instantaneous speed at the epoch
+    """
+    speed_dict = {}
+    speed_dict['value'] = float(current.speeds[i])
+    speed_dict['units'] = "km/s"
+    return speed_dict
+
+def location_at(current: State, i: int) -> dict:
+    """
+    Looks up the precomputed latitude, longitude, and altitude at a row of the dataset and finds the geoposition
+
+    Args:
+        current (State): the dataset to read from
+        i (int): the row of the epoch in the dataset
+
+    Returns:
+        location_data (dict): the dictionary of location information at the epoch
+    """
+    location_data = {}
+    location_data['LATITUDE'] = float(current.latitudes[i])
+    location_data['LONGITUDE'] = float(current.longitudes[i])
+    location_data['ALTITUDE'] = { 'value': float(current.altitudes[i]),
+                                  'units': "km" }
+    geoposition = reverse_geocode(round(location_data['LATITUDE']*10), round(location_data['LONGITUDE']*10))
+    if (geoposition is None):
+        location_data['GEOPOSITION'] = "No geolocation data available, ISS is over the ocean"
+    else:
+        location_data['GEOPOSITION'] = geoposition.raw["address"]
+    return location_data
+
 @app.route('/epochs/<epoch>/speed', methods=['GET'])
 def get_speed(epoch: str) -> dict:
     """
-    Uses the get_state_vectors function to find the state vectors and calculate the instantaneous speed at that time stamp
+    Looks up the precomputed instantaneous speed at the specified time stamp
 
     Args:
         epoch (str): the time stamp for a data point
 
     Returns:
-        speed_dict (dict): the instantaneous speed at the time stamp, if epoch was not found in the dataset, will return empty dictionary
+        speed_dict (dict): the instantaneous speed at the time stamp, if epoch was not found in the dataset, will return a 404 error
     """
-    epoch_dat = get_state_vectors(epoch)
-    speed_dict = {}
-    if len(epoch_dat) != 0:
-        speed_dict['value'] = math.sqrt(epoch_dat['X_DOT']**2 + epoch_dat['Y_DOT']**2 + epoch_dat['Z_DOT']**2)
-        speed_dict['units'] = "km/s"
-    return speed_dict
+    current = state
+    i = current.epoch_index.get(epoch)
+    if i is None:
+        abort(404, description=f'Epoch {epoch} was not found in the ISS dataset')
+    return speed_at(current, i)
 
 @app.route('/epochs/<epoch>/location', methods=['GET'])
 def get_location(epoch: str) -> dict:
     """
-    Uses the get_state_vectors function to find the state vectors and calculate the latitude, longitude, altitude, and geoposition
+    Looks up the precomputed latitude, longitude, and altitude for the epoch and finds the geoposition
 
     Args:
         epoch (str): the time stamp for a data point
 
     Returns:
-        location_data (dict): the dictionary of location information at specified epoch, if epoch was not found in the dataset, will return an empty dict
+        location_data (dict): the dictionary of location information at specified epoch, if epoch was not found in the dataset, will return a 404 error
     """
-    epoch_dat = get_state_vectors(epoch)
-    location_data = {}
-    if len(epoch_dat) != 0:
-        epoch = epoch_dat['EPOCH']
-        hrs = int(epoch[9:11])
-        mins = int(epoch[12:14])
-        x = epoch_dat['X']
-        y = epoch_dat['Y']
-        z = epoch_dat['Z']
-        location_data['LATITUDE'] = math.degrees(math.atan2(z, math.sqrt(x**2 + y**2)))
-        longitude = math.degrees(math.atan2(y, x)) - ((hrs-12)+(mins/60))*(360/24) + 32
-        if (longitude > 180):
-            location_data['LONGITUDE'] = longitude - 360
-        elif (longitude < -180):
-            location_data['LONGITUDE'] = longitude + 360
-        else:
-            location_data['LONGITUDE'] = longitude
-        location_data['ALTITUDE'] = { 'value': math.sqrt(x**2 + y**2 + z**2) - MEAN_EARTH_RADIUS,
-                                      'units': "km" }
-        geoposition = geocoder.reverse((location_data['LATITUDE'], location_data['LONGITUDE']), zoom=10, language='en')
-        if (geoposition is None):
-            location_data['GEOPOSITION'] = "No geolocation data available, ISS is over the ocean"
-        else:
-            location_data['GEOPOSITION'] = geoposition.raw["address"]
-    return location_data
+    current = state
+    i = current.epoch_index.get(epoch)
+    if i is None:
+        abort(404, description=f'Epoch {epoch} was not found in the ISS dataset')
+    return location_at(current, i)
 
 @app.route('/now', methods=['GET'])
 def get_now() -> dict:
@@ -152,25 +408,21 @@ def get_now() -> dict:
     Returns:
         iss_now (dict): the dictionary of location information, closest epoch, and speed
     """
+    current = state
     iss_now = {}
-    if len(iss_data) == 0:
+    if len(current.epochs) == 0:
         return {}
-    min_difference = time.time() - time.mktime(time.strptime(iss_data[0]['EPOCH'][:-5], '%Y-%jT%H:%M:%S'))
-    min_state_vec = iss_data[0]
-    for state_vec in iss_data:
-        epoch = state_vec['EPOCH']
-        # gives present time in seconds since unix epoch
-        time_now = time.time()
-        # gives epoch (eg 2023-058T12:00:00.000Z) time in seconds since unix epoch
-        time_epoch = time.mktime(time.strptime(epoch[:-5], '%Y-%jT%H:%M:%S'))
-        difference = time_now - time_epoch
-        if abs(difference) < abs(min_difference):
-            min_difference = difference
-            min_state_vector = state_vec
-    iss_now['closest_epoch'] = min_state_vector['EPOCH']
-    iss_now['time_difference (sec)'] = min_difference
-    iss_now['location'] = get_location(min_state_vector['EPOCH'])
-    iss_now['speed'] = get_speed(min_state_vector['EPOCH'])
+    # gives present time in seconds since unix epoch
+    time_now = time.time()
+    # the epochs are in time order, so binary search for the first epoch after now and compare it with the one before
+    epoch_secs = current.epoch_secs
+    i = int(np.searchsorted(epoch_secs, time_now))
+    if i == len(epoch_secs) or (i > 0 and time_now - epoch_secs[i-1] <= epoch_secs[i] - time_now):
+        i -= 1
+    iss_now['closest_epoch'] = str(current.epochs[i])
+    iss_now['time_difference (sec)'] = time_now - float(epoch_secs[i])
+    iss_now['location'] = location_at(current, i)
+    iss_now['speed'] = speed_at(current, i)
     return iss_now
 
 
@@ -200,30 +452,27 @@ def delete_data() -> str:
     Returns:
         output (str): indicates that the data was deleted from the file
     """
-    global iss_data
-    iss_data = []
+    global state
+    # build the empty dataset first and then swap it in, so requests in progress keep reading the old one
+    state = build_state(serialize_responses([], {}, {}, []), [], [], [])
     return 'ISS Data has been deleted\n'
 
 @app.route('/post-data', methods=['POST'])
 def post_data() -> str:
     """
-    Reloads the ISS data and adds to the json file again
+    Asks the background refresh thread to reload the ISS data now, returns without waiting for the download
 
     Args:
         no arguments
 
     Returns:
-        output (str): message that indicates that the ISS data was reloaded
+        output (str): message that indicates that the ISS data reload was requested
     """
-    response = requests.get(url='https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml')
-    global iss_data 
-    iss_data = xmltodict.parse(response.text)
-    # get the state vectors data
-    iss_data = iss_data['ndm']['oem']['body']['segment']['data']['stateVector']
-    return 'ISS Data has been reloaded\n'
+    refresh_requested.set()
+    return 'ISS Data reload has been requested\n'
 
 @app.route('/comment', methods=['GET'])
-def get_comment_data() -> list:
+def get_comment_data() -> Response:
     """
     return the list of comments in the ISS dataset
 
@@ -231,15 +480,13 @@ def get_comment_data() -> list:
         no arguments
 
     Returns:
-        output (list): list of comments in ISS dataset
+        output (Response): list of comments in ISS dataset as JSON
     """
-    if len(iss_data) == 0:
-        return []
-    output = iss_data_all['ndm']['oem']['body']['segment']['data']['COMMENT']
+    output = Response(state.cached_responses['comment'], mimetype='application/json')
     return output
 
 @app.route('/header', methods=['GET'])
-def get_header_data() -> dict:
+def get_header_data() -> Response:
     """
     return the dictionary for the header in the ISS dataset
 
@@ -247,15 +494,13 @@ def get_header_data() -> dict:
         no arguments
 
     Returns:
-        output (dict): header dictionary in ISS dataset
+        output (Response): header dictionary in ISS dataset as JSON
     """
-    if len(iss_data) == 0:
-        return {}
-    output = iss_data_all['ndm']['oem']['header']
+    output = Response(state.cached_responses['header'], mimetype='application/json')
     return output
 
 @app.route('/metadata', methods=['GET'])
-def get_metadata() -> dict:
+def get_metadata() -> Response:
     """
     return the dictionary for metadata in the ISS dataset
 
@@ -263,11 +508,9 @@ def get_metadata() -> dict:
         no arguments
 
     Returns:
-        output (dict): metadata dictionary in ISS dataset
+        output (Response): metadata dictionary in ISS dataset as JSON
     """
-    if len(iss_data) == 0:
-        return {}
-    output = iss_data_all['ndm']['oem']['body']['segment']['metadata']
+    output = Response(state.cached_responses['metadata'], mimetype='application/json')
     return output
 
 if __name__ == '__main__':